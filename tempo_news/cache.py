@@ -0,0 +1,33 @@
+"""Small in-memory cache with per-entry expiry."""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """Thread-safe cache whose entries expire after a time-to-live."""
+
+    _MISSING = object()
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or default if it is missing or expired."""
+        with self._lock:
+            expires_at, value = self._entries.get(key, (0.0, self._MISSING))
+            if value is self._MISSING or time.monotonic() >= expires_at:
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """Cache a value for ttl seconds."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, key: Hashable):
+        """Drop a cached value."""
+        with self._lock:
+            self._entries.pop(key, None)
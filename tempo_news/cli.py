@@ -1,15 +1,12 @@
 """Command line interface for Tempo News fetcher."""
 
+import heapq
+import os
 import click
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
 
-from .models import FetchConfig
-from .fetcher import RSSFetcher
-from .markdown_writer import MarkdownWriter
-from .rag_integration import RAGIntegration
-
 console = Console()
 
 
@@ -39,9 +36,15 @@ console = Console()
 @click.option(
     '--rate-limit', 
     default=1.0,
-    help='Delay between requests in seconds',
+    help='Initial delay in seconds between requests to a domain (adapts to server responses)',
     type=float
 )
+@click.option(
+    '--concurrency',
+    default=4,
+    help='Number of articles to fetch in parallel',
+    type=click.IntRange(min=1)
+)
 @click.option(
     '--user-agent', 
     default="The Tempo News Fetcher 1.0",
@@ -58,10 +61,16 @@ console = Console()
     type=click.Path(exists=True, path_type=Path)
 )
 def main(url: str, output_dir: Path, max_articles: int, no_content: bool, 
-         rate_limit: float, user_agent: str, rag_app_name: str,
+         rate_limit: float, concurrency: int, user_agent: str, rag_app_name: str,
          syftbox_config: Optional[Path]):
     """Fetch news articles from Tempo RSS feed and save as markdown files."""
     
+    # Imported here so that `stats` doesn't pay for the fetch dependencies
+    from .models import FetchConfig
+    from .fetcher import RSSFetcher
+    from .markdown_writer import MarkdownWriter
+    from .rag_integration import RAGIntegration
+    
     console.print(f"[bold blue]Tempo News Fetcher[/bold blue]")
     console.print(f"RSS URL: {url}")
     console.print(f"Output Directory: {output_dir}")
@@ -76,6 +85,7 @@ def main(url: str, output_dir: Path, max_articles: int, no_content: bool,
         max_articles=max_articles,
         user_agent=user_agent,
         rate_limit_delay=rate_limit,
+        concurrency=concurrency,
         fetch_full_content=not no_content,
         enable_rag=True,
         rag_app_name=rag_app_name,
@@ -84,44 +94,48 @@ def main(url: str, output_dir: Path, max_articles: int, no_content: bool,
     
     try:
         # Initialize fetcher, writer, and RAG integration
-        fetcher = RSSFetcher(config)
-        writer = MarkdownWriter(config.output_dir)
-        rag_integration = RAGIntegration(config)
-        
-        # Setup RAG connection (always enabled)
-        console.print(f"RAG App Name: {rag_app_name}")
-        rag_connected = rag_integration.setup_rag_connection()
-        
-        # Check if RAG server is recognized and running - skip news fetching if not
-        if not rag_connected:
-            console.print("[yellow]RAG server not recognized or not running. Skipping news fetching workflow.[/yellow]")
-            console.print("[dim]News articles will only be fetched when RAG server is available and tagged as running.[/dim]")
-            return
-        
-        console.print(f"[dim]Articles will be automatically indexed by RAG when saved[/dim]")
-        
-        # Fetch articles (only if RAG server is available)
-        console.print("[bold]Fetching articles...[/bold]")
-        articles = fetcher.fetch_articles()
-        
-        if not articles:
-            console.print("[red]No articles found![/red]")
-            return
-        
-        # Write articles to markdown
-        console.print(f"\n[bold]Writing {len(articles)} articles to markdown...[/bold]")
-        written_files = writer.write_articles(articles)
-        
-        # RAG integration happens automatically via folder watching
-        if rag_integration.is_connected and rag_integration.folder_registered:
-            console.print(f"[dim]New articles will be automatically indexed by RAG[/dim]")
-        
-        if written_files:
-            console.print(f"\n[bold green]✓ Successfully processed articles![/bold green]")
-            console.print(f"Articles saved to: {output_dir.absolute()}")
-        else:
-            console.print(f"\n[yellow]No new articles to process.[/yellow]")
+        with MarkdownWriter(config.output_dir) as writer, \
+                RAGIntegration(config) as rag_integration:
+            fetcher = RSSFetcher(config, metadata=writer.metadata)
+            
+            # Setup RAG connection (always enabled)
+            console.print(f"RAG App Name: {rag_app_name}")
+            rag_connected = rag_integration.setup_rag_connection()
+            
+            # Check if RAG server is recognized and running - skip news fetching if not
+            if not rag_connected:
+                console.print("[yellow]RAG server not recognized or not running. Skipping news fetching workflow.[/yellow]")
+                console.print("[dim]News articles will only be fetched when RAG server is available and tagged as running.[/dim]")
+                return
+            
+            console.print(f"[dim]Articles will be automatically indexed by RAG when saved[/dim]")
+            
+            # Fetch articles (only if RAG server is available)
+            console.print("[bold]Fetching articles...[/bold]")
+            articles = fetcher.fetch_articles()
+            
+            if not articles:
+                fetcher.save_feed_validators()
+                console.print("[yellow]No new articles found.[/yellow]")
+                return
+            
+            # Write articles to markdown
+            console.print(f"\n[bold]Writing {len(articles)} articles to markdown...[/bold]")
+            written_files = writer.write_articles(articles)
+            
+            # Only now may an unchanged feed be skipped on the next run
+            fetcher.save_feed_validators()
+            
+            # RAG integration happens automatically via folder watching
+            if rag_integration.is_connected and rag_integration.folder_registered:
+                console.print(f"[dim]New articles will be automatically indexed by RAG[/dim]")
             
+            if written_files:
+                console.print(f"\n[bold green]✓ Successfully processed articles![/bold green]")
+                console.print(f"Articles saved to: {output_dir.absolute()}")
+            else:
+                console.print(f"\n[yellow]No new articles to process.[/yellow]")
+                
     except KeyboardInterrupt:
         console.print("\n[yellow]Operation cancelled by user.[/yellow]")
     except Exception as e:
@@ -143,16 +157,17 @@ def stats(output_dir: Path):
     console.print(f"Directory: {output_dir.absolute()}")
     console.print()
     
-    # Count markdown files
-    md_files = list(output_dir.glob("*.md"))
-    console.print(f"Total articles: {len(md_files)}")
+    # Count markdown files (scandir entries cache their stat results)
+    with os.scandir(output_dir) as it:
+        entries = [e for e in it if e.name.endswith('.md') and e.is_file()]
+    console.print(f"Total articles: {len(entries)}")
     
-    if md_files:
+    if entries:
         console.print(f"\nRecent articles:")
-        # Sort by modification time to show most recent first
-        sorted_files = sorted(md_files, key=lambda f: f.stat().st_mtime, reverse=True)
-        for file_path in sorted_files[:10]:  # Show last 10 articles
-            console.print(f"  • {file_path.stem}")
+        # Most recently modified first, without sorting the whole directory
+        recent = heapq.nlargest(10, entries, key=lambda e: e.stat().st_mtime)
+        for entry in recent:  # Show last 10 articles
+            console.print(f"  • {Path(entry.name).stem}")
 
 
 @click.group()
@@ -1,38 +1,123 @@
 """RSS feed fetcher for Tempo NYC."""
 
-import feedparser
+import multiprocessing
+import os
+import re
+import fastfeedparser as feedparser
 import requests
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
-from typing import List, Optional
+from html import unescape
+from typing import List, Optional, Tuple
 from urllib.parse import urljoin
 from dateutil import parser as date_parser
 from rich.console import Console
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.progress import Progress, TaskID
 
+from .metadata_store import MetadataStore
 from .models import Article, FetchConfig
+from .rate_limiter import DomainLimiter
 
 console = Console()
 
+_HTML_TAG = re.compile(r'<[^>]+>')
+
+
+def _extract_content(html: bytes, url: str) -> Optional[Tuple[Optional[str], Optional[str], Optional[str]]]:
+    """Extract (text, author, date) from article HTML.
+    
+    Kept at module level so it can be sent to extraction worker processes.
+    """
+    import trafilatura
+    
+    # One pass yields both the main text and the page metadata
+    document = trafilatura.bare_extraction(
+        html,
+        url=url,
+        favor_precision=True,
+        include_comments=False,
+        with_metadata=True
+    )
+    if document is None:
+        return None
+    
+    return document.text, document.author, document.date
+
 
 class RSSFetcher:
     """Fetches articles from RSS feeds."""
     
-    def __init__(self, config: FetchConfig):
+    def __init__(self, config: FetchConfig, metadata: Optional[MetadataStore] = None):
         self.config = config
+        self.metadata = metadata
+        # Validators of the last fetched feed, saved by save_feed_validators
+        # once its articles have been written
+        self.feed_validators: Optional[Tuple[Optional[str], Optional[str]]] = None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': config.user_agent
         })
+        
+        # Size the connection pool to the worker count so keep-alive
+        # connections are reused across fetcher threads, and retry transient
+        # gateway errors. 429s and 503s are throttling signals, so they are
+        # not retried here (urllib3 would otherwise retry them whenever they
+        # carry a Retry-After) and go straight to the adaptive rate limiter,
+        # which honours Retry-After itself.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 504),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=config.concurrency,
+            pool_maxsize=config.concurrency,
+            max_retries=retry
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Starts at one request per rate_limit_delay for each domain and
+        # adapts to how the server responds
+        rate = 1 / config.rate_limit_delay if config.rate_limit_delay > 0 else 0
+        self.rate_limiter = DomainLimiter(rate=rate, capacity=config.rate_limit_burst)
     
     def fetch_rss_feed(self) -> List[Article]:
         """Fetch and parse RSS feed."""
         console.print(f"[blue]Fetching RSS feed from: {self.config.rss_url}[/blue]")
         
         try:
-            feed = feedparser.parse(self.config.rss_url)
+            # Conditional GET: an unchanged feed comes back as an empty 304
+            headers = {}
+            if self.metadata is not None:
+                etag, last_modified = self.metadata.get_feed_validators(self.config.rss_url)
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            response = self.session.get(self.config.rss_url, headers=headers, timeout=10)
+            
+            if response.status_code == 304:
+                console.print("[green]RSS feed not modified since last fetch[/green]")
+                return []
+            
+            response.raise_for_status()
             
-            if feed.bozo:
-                console.print(f"[yellow]Warning: Feed parsing errors: {feed.bozo_exception}[/yellow]")
+            feed = feedparser.parse(
+                response.content,
+                include_media=False,
+                include_enclosures=False
+            )
+            
+            self.feed_validators = (
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
             
             console.print(f"[green]Found {len(feed.entries)} articles in RSS feed[/green]")
             
@@ -48,33 +133,42 @@ class RSSFetcher:
             console.print(f"[red]Error fetching RSS feed: {e}[/red]")
             return []
     
+    def save_feed_validators(self):
+        """Persist the fetched feed's ETag and Last-Modified.
+        
+        Call only after the feed's articles have been written: once saved,
+        an unchanged feed is answered with a 304 and its entries are not
+        looked at again.
+        """
+        if self.metadata is not None and self.feed_validators is not None:
+            self.metadata.save_feed_validators(self.config.rss_url, *self.feed_validators)
+            self.feed_validators = None
+    
     def _parse_rss_entry(self, entry) -> Optional[Article]:
         """Parse RSS entry into Article model."""
         try:
-            # Parse publication date
+            # Parse publication date (fastfeedparser emits ISO 8601 UTC)
             published = None
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                published = datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, 'published'):
+            if entry.get('published'):
                 try:
-                    published = date_parser.parse(entry.published)
-                except:
-                    pass
+                    published = datetime.fromisoformat(entry.published)
+                except ValueError:
+                    try:
+                        published = date_parser.parse(entry.published)
+                    except (ValueError, OverflowError):
+                        pass
             
             # Extract categories
-            categories = []
-            if hasattr(entry, 'tags'):
-                categories = [tag.term for tag in entry.tags]
+            categories = [tag['term'] for tag in entry.get('tags', []) if tag.get('term')]
             
             # Get author
-            author = getattr(entry, 'author', None)
+            author = entry.get('author')
             
             # Get summary
-            summary = getattr(entry, 'summary', None)
+            summary = entry.get('summary') or entry.get('description')
             if summary:
                 # Clean HTML from summary
-                from bs4 import BeautifulSoup
-                summary = BeautifulSoup(summary, 'html.parser').get_text().strip()
+                summary = self._strip_html(summary)
             
             article = Article(
                 title=entry.title,
@@ -91,58 +185,137 @@ class RSSFetcher:
             console.print(f"[red]Error parsing RSS entry: {e}[/red]")
             return None
     
+    @staticmethod
+    def _strip_html(text: str) -> Optional[str]:
+        """Strip HTML tags from an RSS summary."""
+        # Summaries are short snippets, so a regex strip is enough and
+        # avoids building a DOM for each one
+        text = unescape(_HTML_TAG.sub('', text)).strip()
+        return text or None
+    
     def fetch_article_content(self, article: Article) -> Article:
         """Fetch full article content."""
         if not self.config.fetch_full_content:
             return article
         
+        html = self._download_article_html(article)
+        if html is None:
+            return article
+        
+        return self._extract_article_content(article, html)
+    
+    def _download_article_html(self, article: Article) -> Optional[bytes]:
+        """Download the raw HTML of an article page."""
         try:
             console.print(f"[dim]Fetching content for: {article.title}[/dim]")
             
-            response = self.session.get(str(article.url), timeout=10)
+            url = article.url
+            self.rate_limiter.acquire(url)
+            response = self.session.get(url, timeout=10)
+            self.rate_limiter.record(url, response.status_code, response.headers.get('Retry-After'))
             response.raise_for_status()
             
-            from newspaper import Article as NewsArticle
-            
-            news_article = NewsArticle(str(article.url))
-            news_article.download(input_html=response.text)
-            news_article.parse()
-            
-            if news_article.text:
-                article.content = news_article.text
-            
-            # Update other fields if they weren't in RSS
-            if not article.author and news_article.authors:
-                article.author = ', '.join(news_article.authors)
-            
-            if not article.published and news_article.publish_date:
-                article.published = news_article.publish_date
-            
-            return article
+            # Raw bytes let the extractor detect the page encoding itself
+            return response.content
             
         except Exception as e:
             console.print(f"[yellow]Warning: Could not fetch content for {article.url}: {e}[/yellow]")
+            return None
+    
+    def _extract_article_content(self, article: Article, html: bytes) -> Article:
+        """Extract article text and metadata from downloaded HTML."""
+        try:
+            extracted = _extract_content(html, article.url)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not extract content for {article.url}: {e}[/yellow]")
+            return article
+        
+        return self._apply_extracted(article, extracted)
+    
+    def _apply_extracted(self, article: Article,
+                         extracted: Optional[Tuple[Optional[str], Optional[str], Optional[str]]]) -> Article:
+        """Update article with the output of _extract_content."""
+        if extracted is None:
             return article
+        
+        text, author, date = extracted
+        
+        if text:
+            article.content = text
+        
+        # Update other fields if they weren't in RSS
+        if not article.author and author:
+            article.author = ', '.join(author.split('; '))
+        
+        if not article.published and date:
+            try:
+                article.published = datetime.fromisoformat(date)
+            except ValueError:
+                pass
+        
+        return article
     
     def fetch_articles(self) -> List[Article]:
         """Fetch articles from RSS feed with content."""
         articles = self.fetch_rss_feed()
         
+        # Drop already-processed articles before paying for their content
+        if self.metadata is not None:
+            new_articles = [a for a in articles if a.url not in self.metadata]
+            skipped = len(articles) - len(new_articles)
+            if skipped:
+                console.print(f"[dim]Skipping {skipped} already processed articles[/dim]")
+            articles = new_articles
+        
         if not articles:
             return []
         
+        if not self.config.fetch_full_content:
+            return articles
+        
         console.print(f"[blue]Fetching full content for {len(articles)} articles...[/blue]")
         
-        with Progress() as progress:
+        # Extraction is CPU-bound, so it runs in worker processes. Forking a
+        # process that already has download threads running is unsafe, so
+        # prefer a forkserver where the platform has one.
+        extract_workers = min(os.cpu_count() or 1, len(articles))
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        
+        with Progress() as progress, \
+                ThreadPoolExecutor(max_workers=self.config.concurrency) as downloader, \
+                ProcessPoolExecutor(max_workers=extract_workers,
+                                    mp_context=multiprocessing.get_context(start_method)) as extractor:
             task = progress.add_task("Fetching articles...", total=len(articles))
             
-            for i, article in enumerate(articles):
-                articles[i] = self.fetch_article_content(article)
-                progress.update(task, advance=1)
+            downloads = {
+                downloader.submit(self._download_article_html, article): i
+                for i, article in enumerate(articles)
+            }
+            extractions = {}
+            
+            def collect(futures):
+                for future in futures:
+                    i = extractions.pop(future)
+                    try:
+                        articles[i] = self._apply_extracted(articles[i], future.result())
+                    except Exception as e:
+                        console.print(f"[yellow]Warning: Could not extract content for {articles[i].url}: {e}[/yellow]")
+                    progress.update(task, advance=1)
+            
+            for future in as_completed(downloads):
+                i = downloads[future]
+                html = future.result()
+                if html is None:
+                    progress.update(task, advance=1)
+                    continue
+                
+                # Backpressure: cap the pages queued for extraction
+                if len(extractions) >= 2 * extract_workers:
+                    done, _ = wait(extractions, return_when=FIRST_COMPLETED)
+                    collect(done)
                 
-                # Rate limiting
-                if i < len(articles) - 1:  # Don't delay after last article
-                    import time
-                    time.sleep(self.config.rate_limit_delay)
+                extractions[extractor.submit(_extract_content, html, articles[i].url)] = i
+            
+            collect(list(as_completed(extractions)))
         
-        return articles
\ No newline at end of file
+        return articles
@@ -1,69 +1,81 @@
 """Markdown file writer for articles."""
 
-import json
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set
-from datetime import datetime
+from typing import List
 from rich.console import Console
 
+from .metadata_store import MetadataStore
 from .models import Article
 
 console = Console()
 
+# Common unicode punctuation and its ASCII equivalent; Latin combining
+# diacritics (left behind by NFKD decomposition) are dropped outright
+_UNICODE_TRANS = str.maketrans({
+    **{chr(c): None for c in range(0x0300, 0x0370)},
+    '\u2013': '-',    # en dash
+    '\u2014': '--',   # em dash
+    '\u2018': "'",    # left single quotation mark
+    '\u2019': "'",    # right single quotation mark
+    '\u201c': '"',    # left double quotation mark
+    '\u201d': '"',    # right double quotation mark
+    '\u2026': '...',  # horizontal ellipsis
+    '\u00a0': ' ',    # non-breaking space
+    '\u2022': '*',    # bullet point
+    '\u00ab': '<<',   # left-pointing double angle quotation mark
+    '\u00bb': '>>',   # right-pointing double angle quotation mark
+})
+
 
 class MarkdownWriter:
     """Writes articles as markdown files."""
     
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, max_workers: int = 4):
         self.output_dir = Path(output_dir)
-        self.metadata_file = self.output_dir / ".metadata.json"
+        self.max_workers = max_workers
         self._ensure_output_dir()
-        self._load_existing_urls()
+        self.metadata = MetadataStore(
+            self.output_dir / ".metadata.db",
+            legacy_json=self.output_dir / ".metadata.json"
+        )
+    
+    def __enter__(self) -> "MarkdownWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the metadata store."""
+        self.metadata.close()
     
     def _ensure_output_dir(self):
         """Create output directory if it doesn't exist."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
-    def _load_existing_urls(self) -> Set[str]:
-        """Load existing article URLs from metadata."""
-        self.existing_urls = set()
-        if self.metadata_file.exists():
-            try:
-                with open(self.metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    self.existing_urls = set(metadata.get('processed_urls', []))
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not load metadata: {e}[/yellow]")
-        return self.existing_urls
-    
     def _save_metadata(self, new_urls: List[str]):
         """Save metadata with processed URLs."""
         try:
-            metadata = {
-                'last_updated': datetime.now().isoformat(),
-                'processed_urls': list(self.existing_urls.union(new_urls))
-            }
-            with open(self.metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            self.metadata.add_urls(new_urls)
         except Exception as e:
             console.print(f"[yellow]Warning: Could not save metadata: {e}[/yellow]")
     
     def is_article_processed(self, article: Article) -> bool:
         """Check if article has already been processed."""
-        return str(article.url) in self.existing_urls
+        return article.url in self.metadata
     
     def write_article(self, article: Article) -> Path:
         """Write article to markdown file."""
         file_path = article.get_file_path(self.output_dir)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Generate markdown content
-        markdown_content = self._generate_markdown(article)
+        # Generate markdown content, encoded once as ASCII
+        payload = self._generate_markdown(article).encode('ascii', errors='replace')
         
-        # Write to file (using ASCII-compatible encoding)
-        with open(file_path, 'w', encoding='ascii', errors='replace') as f:
-            f.write(markdown_content)
+        # Single open/write/close per file
+        file_path.write_bytes(payload)
         
         console.print(f"[green]✓[/green] Saved: {file_path.relative_to(self.output_dir)}")
         return file_path
@@ -72,36 +84,41 @@ class MarkdownWriter:
         """Generate markdown content for article."""
         lines = []
         
+        # Normalize each field once; most are used in several places
+        title = self._normalize_text(article.title)
+        author = self._normalize_text(article.author) if article.author else None
+        categories = [self._normalize_text(c) for c in article.categories]
+        
         # Frontmatter
         lines.append("---")
-        lines.append(f"title: \"{self._escape_yaml(self._normalize_text(article.title))}\"")
+        lines.append(f"title: \"{self._escape_yaml(title)}\"")
         lines.append(f"url: {article.url}")
         
-        if article.author:
-            lines.append(f"author: \"{self._escape_yaml(self._normalize_text(article.author))}\"")
+        if author:
+            lines.append(f"author: \"{self._escape_yaml(author)}\"")
         
         if article.published:
             lines.append(f"published: {article.published.isoformat()}")
             lines.append(f"date: {article.published.strftime('%Y-%m-%d')}")
         
-        if article.categories:
+        if categories:
             lines.append("categories:")
-            for category in article.categories:
-                lines.append(f"  - \"{self._escape_yaml(self._normalize_text(category))}\"")
+            for category in categories:
+                lines.append(f"  - \"{self._escape_yaml(category)}\"")
         
         lines.append(f"slug: {article.generate_slug()}")
         lines.append("---")
         lines.append("")
         
         # Title
-        lines.append(f"# {self._normalize_text(article.title)}")
+        lines.append(f"# {title}")
         lines.append("")
         
         # Metadata
-        if article.author or article.published:
+        if author or article.published:
             metadata_parts = []
-            if article.author:
-                metadata_parts.append(f"**By:** {self._normalize_text(article.author)}")
+            if author:
+                metadata_parts.append(f"**By:** {author}")
             if article.published:
                 metadata_parts.append(f"**Published:** {article.published.strftime('%B %d, %Y')}")
             
@@ -109,8 +126,8 @@ class MarkdownWriter:
             lines.append("")
         
         # Categories
-        if article.categories:
-            category_tags = [f"`{self._normalize_text(cat)}`" for cat in article.categories]
+        if categories:
+            category_tags = [f"`{cat}`" for cat in categories]
             lines.append(f"**Categories:** {' '.join(category_tags)}")
             lines.append("")
         
@@ -142,31 +159,19 @@ class MarkdownWriter:
         if not text:
             return ""
         
-        # Normalize unicode characters to their closest ASCII equivalents
-        # NFD = decomposed form, then filter out combining characters
-        normalized = unicodedata.normalize('NFD', text)
-        ascii_text = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-        
-        # Replace common unicode punctuation with ASCII equivalents
-        replacements = {
-            '\u2013': '-',    # en dash
-            '\u2014': '--',   # em dash
-            '\u2018': "'",    # left single quotation mark
-            '\u2019': "'",    # right single quotation mark
-            '\u201c': '"',    # left double quotation mark
-            '\u201d': '"',    # right double quotation mark
-            '\u2026': '...',  # horizontal ellipsis
-            '\u00a0': ' ',    # non-breaking space
-            '\u2022': '*',    # bullet point
-            '\u00ab': '<<',   # left-pointing double angle quotation mark
-            '\u00bb': '>>',   # right-pointing double angle quotation mark
-        }
-        
-        for unicode_char, ascii_char in replacements.items():
-            ascii_text = ascii_text.replace(unicode_char, ascii_char)
-        
-        # Remove any remaining non-ASCII characters
-        ascii_text = ascii_text.encode('ascii', errors='replace').decode('ascii')
+        # Plain ASCII input needs no normalization
+        if text.isascii():
+            return text
+        
+        # Decompose (folding compatibility characters like ligatures and
+        # full-width forms), then drop diacritics and map punctuation
+        ascii_text = unicodedata.normalize('NFKD', text).translate(_UNICODE_TRANS)
+        
+        # Rare case: combining marks outside the Latin block, or characters
+        # with no ASCII equivalent
+        if not ascii_text.isascii():
+            ascii_text = ''.join(c for c in ascii_text if unicodedata.category(c) != 'Mn')
+            ascii_text = ascii_text.encode('ascii', errors='replace').decode('ascii')
         
         return ascii_text
     
@@ -198,18 +203,25 @@ class MarkdownWriter:
         new_urls = []
         skipped_count = 0
         
+        pending = []
         for article in articles:
             if self.is_article_processed(article):
                 skipped_count += 1
                 console.print(f"[dim]Skipping (already processed): {article.title}[/dim]")
                 continue
+            pending.append(article)
+        
+        # Each article goes to its own file, so writes can run in parallel
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.write_article, article) for article in pending]
             
-            try:
-                file_path = self.write_article(article)
-                written_files.append(file_path)
-                new_urls.append(str(article.url))
-            except Exception as e:
-                console.print(f"[red]Error writing article '{article.title}': {e}[/red]")
+            for article, future in zip(pending, futures):
+                try:
+                    file_path = future.result()
+                    written_files.append(file_path)
+                    new_urls.append(article.url)
+                except Exception as e:
+                    console.print(f"[red]Error writing article '{article.title}': {e}[/red]")
         
         # Update metadata
         if new_urls:
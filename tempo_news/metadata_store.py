@@ -0,0 +1,101 @@
+"""SQLite-backed metadata store for processed articles."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+import orjson
+from rich.console import Console
+
+console = Console()
+
+
+class MetadataStore:
+    """Tracks processed article URLs in a SQLite database.
+
+    Membership checks are indexed lookups and each run only inserts the
+    URLs it added, instead of re-reading and rewriting the whole index.
+    """
+
+    def __init__(self, db_path: Path, legacy_json: Optional[Path] = None):
+        """Open (or create) the metadata database.
+
+        Args:
+            db_path: Path to the SQLite database file
+            legacy_json: Old .metadata.json to import into a fresh database
+        """
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS processed (url TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS feeds "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT)"
+        )
+
+        if legacy_json is not None and len(self) == 0:
+            self._import_legacy_json(Path(legacy_json))
+
+    def __contains__(self, url: str) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM processed WHERE url = ? LIMIT 1", (url,)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+
+    def add_urls(self, urls: Iterable[str]):
+        """Record processed URLs in a single transaction."""
+        self.conn.execute("BEGIN")
+        try:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO processed VALUES (?)",
+                ((url,) for url in urls)
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('last_updated', ?)",
+                (datetime.now().isoformat(),)
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def get_feed_validators(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get the cached ETag and Last-Modified values for a feed."""
+        row = self.conn.execute(
+            "SELECT etag, last_modified FROM feeds WHERE url = ?", (url,)
+        ).fetchone()
+        return row if row is not None else (None, None)
+
+    def save_feed_validators(self, url: str, etag: Optional[str], last_modified: Optional[str]):
+        """Cache the ETag and Last-Modified values returned for a feed."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO feeds VALUES (?, ?, ?)",
+            (url, etag, last_modified)
+        )
+
+    def _import_legacy_json(self, path: Path):
+        """Import processed URLs from the old JSON metadata file."""
+        if not path.exists():
+            return
+
+        try:
+            metadata = orjson.loads(path.read_bytes())
+            urls = metadata.get('processed_urls', [])
+            if urls:
+                self.add_urls(urls)
+                console.print(f"[dim]Imported {len(urls)} processed URLs from {path.name}[/dim]")
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not import legacy metadata: {e}[/yellow]")
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
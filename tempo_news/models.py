@@ -1,16 +1,21 @@
 """Data models for news articles."""
 
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List
-from pydantic import BaseModel, HttpUrl, field_validator
+from urllib.parse import urlparse
+from pydantic import BaseModel, field_validator
+
+_SLUG_NONWORD = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
 
 
 class Article(BaseModel):
     """Represents a news article."""
     
     title: str
-    url: HttpUrl
+    url: str
     author: Optional[str] = None
     published: Optional[datetime] = None
     summary: Optional[str] = None
@@ -24,17 +29,44 @@ class Article(BaseModel):
         """Clean and normalize title."""
         return v.strip().replace('\n', ' ').replace('\r', ' ')
     
+    @field_validator('url')
+    @classmethod
+    def check_url(cls, v: str) -> str:
+        """Require an absolute http(s) URL."""
+        v = v.strip()
+        parsed = urlparse(v)
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            raise ValueError(f"not an http(s) URL: {v!r}")
+        return v
+    
     def generate_slug(self) -> str:
         """Generate URL-friendly slug from title."""
-        import re
         if self.slug:
             return self.slug
         
         slug = self.title.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
+        slug = _SLUG_NONWORD.sub('', slug)
+        slug = _SLUG_DASH.sub('-', slug)
         slug = slug.strip('-')
-        return slug[:100]  # Limit length
+        
+        # Cache so later calls (markdown frontmatter, file path) are free
+        self.slug = slug[:100]  # Limit length
+        return self.slug
+    
+    def to_rag_dict(self) -> dict:
+        """Build the payload sent to the RAG service for ingestion.
+        
+        The published datetime is left as is for the JSON encoder.
+        """
+        return {
+            "title": self.title,
+            "content": self.content or self.summary or "",
+            "url": self.url,
+            "author": self.author,
+            "published": self.published,
+            "categories": self.categories,
+            "slug": self.generate_slug()
+        }
     
     def get_file_path(self, base_dir: Path) -> Path:
         """Get the file path for saving this article."""
@@ -50,7 +82,11 @@ class FetchConfig(BaseModel):
     max_articles: int = 50
     user_agent: str = "Tempo News Fetcher 1.0"
     rate_limit_delay: float = 1.0
+    rate_limit_burst: int = 1
+    concurrency: int = 4
     fetch_full_content: bool = True
     enable_rag: bool = True
     rag_app_name: str = "com.github.openmined.local-rag"
+    rag_batch_size: int = 16
+    rag_concurrency: int = 3
     syftbox_config_path: Optional[Path] = None
\ No newline at end of file
@@ -1,15 +1,81 @@
 """RAG integration for ingesting articles into vector database."""
 
-from typing import List, Optional
+import logging
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
 from rich.console import Console
+from rich.progress import Progress
+import orjson
 import requests
-import json
+import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .cache import TTLCache
 from .models import Article, FetchConfig
 from .rag_service import RAGServiceDetector
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+# Use the libyaml bindings for frontmatter parsing when available
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+# (connect, read) timeouts: the service is local, so connecting should be
+# near-instant, while ingestion may take a while to embed the content
+QUERY_TIMEOUT = (2, 5)
+REQUEST_TIMEOUT = (2, 10)
+INGEST_TIMEOUT = (2, 30)
+BATCH_INGEST_TIMEOUT = (2, 60)
+
+# How long read-mostly GET responses are reused before asking again
+WATCHED_FOLDERS_TTL = 30
+STATUS_TTL = 5
+
+# Markdown files ingested at once; reading and posting are both I/O-bound
+MARKDOWN_INGEST_WORKERS = 8
+
+
+def _iter_markdown_files(directory: Path) -> Iterator[Path]:
+    """Lazily yield the markdown files directly inside a directory."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.md') and entry.is_file():
+                yield Path(entry.path)
+
+
+def _read_markdown_file(md_file: Path) -> Optional[Tuple[dict, str]]:
+    """Split a markdown file into its YAML frontmatter and body.
+    
+    The file is memory-mapped so the frontmatter delimiters are found on
+    the raw bytes; only the frontmatter and body slices are decoded.
+    
+    Returns:
+        (frontmatter, body), or None if the file has no frontmatter
+    """
+    with open(md_file, 'rb') as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:3] != b'---':
+                return None
+            
+            end = mm.find(b'\n---', 3)
+            if end == -1:
+                return None
+            
+            frontmatter = yaml.load(mm[3:end], Loader=_YAMLLoader)
+            body = mm[end + 4:].decode('utf-8').strip()
+    
+    return frontmatter, body
 
 
 class RAGIntegration:
@@ -17,11 +83,42 @@ class RAGIntegration:
     
     def __init__(self, config: FetchConfig):
         self.config = config
-        self.detector = RAGServiceDetector(config.syftbox_config_path)
+        
+        # One pooled session for every call to the service, so connections
+        # are kept alive instead of being re-opened per request. Transient
+        # errors are retried with exponential backoff. Read timeouts are not
+        # retried: the service may still be embedding the first copy of an
+        # ingest, and re-sending it would ingest the articles twice.
+        retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "POST"),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        self.detector = RAGServiceDetector(config.syftbox_config_path, session=self.session)
+        self._cache = TTLCache()
         self.service_url: Optional[str] = None
         self.is_connected = False
         self.folder_registered = False
     
+    def __enter__(self) -> "RAGIntegration":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+    
     def setup_rag_connection(self) -> bool:
         """Setup connection to RAG service (always enabled)."""
         
@@ -60,44 +157,75 @@ class RAGIntegration:
                 return True
             
             # Register folder using RAG API
-            response = requests.post(
-                f"{self.service_url}/api/add-folder",
-                json={"folder_path": str(articles_path)},
-                timeout=10,
-                headers={"Content-Type": "application/json"}
+            response = self._post_json(
+                "/api/add-folder", {"folder_path": str(articles_path)}, REQUEST_TIMEOUT
             )
             
             if response.status_code == 200:
                 self.folder_registered = True
+                self._cache.invalidate(f"{self.service_url}/api/watched-folders")
                 console.print(f"[green]✓ Registered folder: {articles_path}[/green]")
                 return True
             else:
                 console.print(f"[yellow]Failed to register folder: HTTP {response.status_code}[/yellow]")
                 return False
                 
-        except Exception as e:
+        except requests.RequestException as e:
             console.print(f"[yellow]Error registering articles folder: {e}[/yellow]")
             return False
     
+    def _post_json(self, path: str, payload: dict, timeout) -> requests.Response:
+        """POST a JSON body to the service.
+        
+        The body is encoded with orjson, which also serializes datetimes
+        (e.g. frontmatter dates parsed by yaml) as ISO 8601 strings.
+
+        The encoded bytes are handed to requests as-is: they are sent
+        without another copy and with a Content-Length, and unlike a
+        streamed (chunked) body they can be replayed when a request is
+        retried.
+        """
+        return self.session.post(
+            f"{self.service_url}{path}",
+            data=orjson.dumps(payload),
+            timeout=timeout,
+            headers={"Content-Type": "application/json"}
+        )
+    
+    def _cached_get(self, path: str, ttl: float) -> Optional[dict]:
+        """GET a JSON endpoint, reusing a successful response for ttl seconds.
+        
+        Returns:
+            Parsed JSON body, or None if the service did not answer with 200
+        """
+        url = f"{self.service_url}{path}"
+        data = self._cache.get(url)
+        if data is not None:
+            return data
+        
+        response = self.session.get(url, timeout=QUERY_TIMEOUT)
+        if response.status_code != 200:
+            return None
+        
+        data = orjson.loads(response.content)
+        self._cache.set(url, data, ttl)
+        return data
+    
     def is_folder_registered(self, folder_path: Path) -> bool:
         """Check if folder is already in the RAG watched folders list."""
         if not self.is_connected or not self.service_url:
             return False
         
         try:
-            response = requests.get(
-                f"{self.service_url}/api/watched-folders",
-                timeout=10
-            )
+            data = self._cached_get("/api/watched-folders", WATCHED_FOLDERS_TTL)
             
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 watched_folders = data.get("folders", [])
                 return str(folder_path) in watched_folders
             else:
                 return False
                 
-        except Exception as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             console.print(f"[dim]Could not check watched folders: {e}[/dim]")
             return False
     
@@ -107,17 +235,14 @@ class RAGIntegration:
             return {"total_documents": 0, "watched_folders": 0}
         
         try:
-            response = requests.get(
-                f"{self.service_url}/api/stats",
-                timeout=10
-            )
+            data = self._cached_get("/api/stats", STATUS_TTL)
             
-            if response.status_code == 200:
-                return response.json()
+            if data is not None:
+                return data
             else:
                 return {"total_documents": 0, "watched_folders": 0}
                 
-        except Exception as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             console.print(f"[dim]Could not get RAG stats: {e}[/dim]")
             return {"total_documents": 0, "watched_folders": 0}
     
@@ -127,17 +252,14 @@ class RAGIntegration:
             return {"status": "disconnected", "queue_size": 0}
         
         try:
-            response = requests.get(
-                f"{self.service_url}/api/indexing-status",
-                timeout=10
-            )
+            data = self._cached_get("/api/indexing-status", STATUS_TTL)
             
-            if response.status_code == 200:
-                return response.json()
+            if data is not None:
+                return data
             else:
                 return {"status": "unknown", "queue_size": 0}
                 
-        except Exception as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             console.print(f"[dim]Could not get indexing status: {e}[/dim]")
             return {"status": "error", "queue_size": 0}
     
@@ -154,41 +276,59 @@ class RAGIntegration:
             return False
         
         try:
-            # Prepare article data for RAG ingestion
-            article_data = {
-                "title": article.title,
-                "content": article.content or article.summary or "",
-                "url": str(article.url),
-                "author": article.author,
-                "published": article.published.isoformat() if article.published else None,
-                "categories": article.categories,
-                "slug": article.generate_slug()
-            }
-            
             # Send to RAG service
-            response = requests.post(
-                f"{self.service_url}/ingest",
-                json=article_data,
-                timeout=30,
-                headers={"Content-Type": "application/json"}
-            )
+            response = self._post_json("/ingest", article.to_rag_dict(), INGEST_TIMEOUT)
             
             if response.status_code == 200:
-                console.print(f"[green]✓ Ingested to RAG: {article.title}[/green]")
+                logger.debug("Ingested to RAG: %s", article.title)
                 return True
             else:
                 console.print(f"[yellow]RAG ingestion failed for '{article.title}': {response.status_code}[/yellow]")
                 return False
                 
-        except Exception as e:
+        except requests.RequestException as e:
             console.print(f"[yellow]RAG ingestion error for '{article.title}': {e}[/yellow]")
             return False
     
-    def ingest_articles(self, articles: List[Article]) -> dict:
-        """Note: Articles are automatically indexed by RAG folder watching.
+    def flush_ingest_batch(self, pending: List[dict]) -> bool:
+        """Ingest a batch of prepared articles with a single request.
+        
+        Args:
+            pending: Article payloads as built by Article.to_rag_dict
+            
+        Returns:
+            True if the whole batch was ingested, False otherwise
+        """
+        if not pending:
+            return True
+        
+        try:
+            response = self._post_json(
+                "/ingest-batch", {"articles": pending}, BATCH_INGEST_TIMEOUT
+            )
+            
+            if response.status_code == 200:
+                console.print(f"[green]✓ Ingested batch of {len(pending)} articles to RAG[/green]")
+                return True
+            else:
+                console.print(f"[yellow]RAG batch ingestion failed ({len(pending)} articles): {response.status_code}[/yellow]")
+                return False
+                
+        except requests.RequestException as e:
+            console.print(f"[yellow]RAG batch ingestion error ({len(pending)} articles): {e}[/yellow]")
+            return False
+    
+    def ingest_articles(self, articles: List[Article], show_queue: bool = False) -> dict:
+        """Ingest articles into the RAG service.
+        
+        When the articles folder is registered, saved articles are indexed
+        automatically by folder watching; otherwise they are sent to the
+        service in batches of ``rag_batch_size``.
         
         Args:
-            articles: List of articles (for compatibility)
+            articles: List of articles to ingest
+            show_queue: Report the RAG indexing queue size when articles are
+                left to folder watching (costs an extra request)
             
         Returns:
             Dictionary with ingestion statistics
@@ -201,9 +341,10 @@ class RAGIntegration:
             console.print(f"[green]✓ {len(articles)} articles will be automatically indexed by RAG folder watching[/green]")
             
             # Get current indexing status
-            status = self.get_indexing_status()
-            if status.get("queue_size", 0) > 0:
-                console.print(f"[dim]RAG indexing queue size: {status['queue_size']}[/dim]")
+            if show_queue:
+                status = self.get_indexing_status()
+                if status.get("queue_size", 0) > 0:
+                    console.print(f"[dim]RAG indexing queue size: {status['queue_size']}[/dim]")
             
             return {
                 "successful": len(articles),
@@ -211,9 +352,69 @@ class RAGIntegration:
                 "skipped": 0,
                 "method": "automatic_folder_watching"
             }
-        else:
-            console.print(f"[yellow]Articles folder not registered - automatic indexing unavailable[/yellow]")
-            return {"successful": 0, "failed": 0, "skipped": len(articles)}
+        
+        # No folder watching, so send the articles explicitly in batches
+        console.print(f"[yellow]Articles folder not registered - ingesting {len(articles)} articles directly[/yellow]")
+        
+        successful = 0
+        failed = 0
+        batch_size = self.config.rag_batch_size
+        batches = [
+            [a.to_rag_dict() for a in articles[start:start + batch_size]]
+            for start in range(0, len(articles), batch_size)
+        ]
+        
+        # Keep a few batches in flight so the service's latency overlaps
+        with ThreadPoolExecutor(max_workers=self.config.rag_concurrency) as executor:
+            for pending, ok in zip(batches, executor.map(self.flush_ingest_batch, batches)):
+                if ok:
+                    successful += len(pending)
+                else:
+                    failed += len(pending)
+        
+        return {
+            "successful": successful,
+            "failed": failed,
+            "skipped": 0,
+            "method": "batch_ingest"
+        }
+    
+    def _ingest_markdown_file(self, md_file: Path) -> Tuple[Optional[bool], str]:
+        """Ingest a single markdown file.
+        
+        Returns:
+            (True, "") if ingested, (False, message) if it failed, or
+            (None, "") if the file has no frontmatter to ingest
+        """
+        try:
+            parsed = _read_markdown_file(md_file)
+            if parsed is None:
+                return None, ""
+            frontmatter, markdown_content = parsed
+            
+            # Frontmatter was validated when the article was written,
+            # so build the Article without re-running validators
+            article = Article.model_construct(
+                title=frontmatter.get("title", md_file.stem),
+                content=markdown_content,
+                url=frontmatter.get("url", ""),
+                author=frontmatter.get("author"),
+                published=frontmatter.get("published"),
+                categories=frontmatter.get("categories", []),
+                slug=frontmatter.get("slug", md_file.stem)
+            )
+            
+            # Send to RAG service
+            response = self._post_json("/ingest", article.to_rag_dict(), INGEST_TIMEOUT)
+            
+            if response.status_code == 200:
+                logger.debug("Ingested %s", md_file.name)
+                return True, ""
+            else:
+                return False, f"[yellow]Failed to ingest: {md_file.name} ({response.status_code})[/yellow]"
+                        
+        except Exception as e:
+            return False, f"[red]Error processing {md_file.name}: {e}[/red]"
     
     def ingest_from_markdown_files(self, markdown_dir: Path) -> dict:
         """Ingest articles from existing markdown files.
@@ -227,54 +428,30 @@ class RAGIntegration:
         if not self.is_connected:
             return {"successful": 0, "failed": 0, "skipped": 0}
         
-        md_files = list(markdown_dir.glob("*.md"))
-        console.print(f"[blue]Found {len(md_files)} markdown files to process[/blue]")
+        console.print(f"[blue]Processing markdown files in {markdown_dir}[/blue]")
         
         successful = 0
         failed = 0
         
-        for md_file in md_files:
-            try:
-                # Read markdown file and extract frontmatter + content
-                content = md_file.read_text(encoding='utf-8')
+        # Several files are in flight at once; progress is reported from
+        # this thread as they complete, printing only the failures
+        with Progress() as progress, \
+                ThreadPoolExecutor(max_workers=MARKDOWN_INGEST_WORKERS) as executor:
+            futures = [executor.submit(self._ingest_markdown_file, md_file)
+                       for md_file in _iter_markdown_files(markdown_dir)]
+            task = progress.add_task("Ingesting markdown files...", total=len(futures))
+            
+            for future in as_completed(futures):
+                ok, message = future.result()
+                progress.update(task, advance=1)
+                if ok is None:
+                    continue
                 
-                # Simple frontmatter parsing (could be enhanced)
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        import yaml
-                        frontmatter = yaml.safe_load(parts[1])
-                        markdown_content = parts[2].strip()
-                        
-                        # Create article-like data for RAG
-                        article_data = {
-                            "title": frontmatter.get("title", md_file.stem),
-                            "content": markdown_content,
-                            "url": frontmatter.get("url", ""),
-                            "author": frontmatter.get("author"),
-                            "published": frontmatter.get("published"),
-                            "categories": frontmatter.get("categories", []),
-                            "slug": frontmatter.get("slug", md_file.stem)
-                        }
-                        
-                        # Send to RAG service
-                        response = requests.post(
-                            f"{self.service_url}/ingest",
-                            json=article_data,
-                            timeout=30,
-                            headers={"Content-Type": "application/json"}
-                        )
-                        
-                        if response.status_code == 200:
-                            console.print(f"[green]✓ Ingested: {md_file.name}[/green]")
-                            successful += 1
-                        else:
-                            console.print(f"[yellow]Failed to ingest: {md_file.name} ({response.status_code})[/yellow]")
-                            failed += 1
-                            
-            except Exception as e:
-                console.print(f"[red]Error processing {md_file.name}: {e}[/red]")
-                failed += 1
+                if ok:
+                    successful += 1
+                else:
+                    progress.console.print(message)
+                    failed += 1
         
         stats = {
             "successful": successful,
@@ -307,15 +484,22 @@ class RAGIntegration:
             "port": self.detector.rag_service_port if self.detector else None,
             "pid": self.detector.rag_service_pid if self.detector else None,
             "available": self.is_connected,
-            "healthy": self.detector.verify_service_health() if self.detector and self.is_connected else False,
+            "healthy": False,
             "folder_registered": self.folder_registered
         }
         
-        # Add RAG stats if connected
+        # Add health and RAG stats if connected; the three GETs are
+        # independent, so they are issued concurrently
         if self.is_connected:
-            stats = self.get_rag_stats()
-            indexing_status = self.get_indexing_status()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                health_future = executor.submit(self.detector.verify_service_health)
+                stats_future = executor.submit(self.get_rag_stats)
+                indexing_future = executor.submit(self.get_indexing_status)
+            
+            stats = stats_future.result()
+            indexing_status = indexing_future.result()
             base_info.update({
+                "healthy": health_future.result(),
                 "total_documents": stats.get("total_documents", 0),
                 "watched_folders_count": stats.get("watched_folders", 0),
                 "indexing_status": indexing_status.get("status", "unknown"),
@@ -323,4 +507,4 @@ class RAGIntegration:
                 "articles_folder_path": str(self.config.output_dir.absolute())
             })
         
-        return base_info
\ No newline at end of file
+        return base_info
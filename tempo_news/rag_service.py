@@ -1,29 +1,57 @@
 """RAG service detection and integration using syft-core."""
 
+import functools
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
+import requests
 from rich.console import Console
 
 from syft_core import Client
 
+from .cache import TTLCache
+
 console = Console()
 
+# How long a health check result is reused
+HEALTH_TTL = 5
+
+
+@functools.lru_cache(maxsize=4)
+def _load_client(config_path: Path, mtime: float) -> Client:
+    """Load a SyftBox client, reusing it until the config file changes."""
+    return Client.load(config_path)
+
+
+@functools.lru_cache(maxsize=4)
+def _app_files(data_dir: Path, app_name: str) -> Tuple[Path, Path, Path]:
+    """Get the folder, pid file and port file of a SyftBox app."""
+    app_folder = data_dir / "apps" / app_name
+    return app_folder, app_folder / "data" / "app.pid", app_folder / "data" / "app.port"
+
 
 class RAGServiceDetector:
     """Detects and connects to RAG service using syft-core."""
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None,
+                 session: Optional[requests.Session] = None):
         """Initialize RAG service detector.
         
         Args:
             config_path: Path to SyftBox config. If None, uses default location.
+            session: HTTP session to reuse for health checks
         """
+        self.session = session or requests.Session()
         self.config_path = config_path or Path.home() / ".syftbox" / "config.json"
         self.rag_service_url: Optional[str] = None
         self.rag_service_port: Optional[str] = None
         self.rag_service_pid: Optional[str] = None
         self.client: Optional[Client] = None
+        self._cache = TTLCache()
+        self._last_health: Dict[str, bool] = {}
+        self._refreshing: Set[str] = set()
+        self._health_lock = threading.Lock()
     
     def detect_rag_service(self, 
                           app_name: str = "com.github.openmined.local-rag",
@@ -44,12 +72,12 @@ class RAGServiceDetector:
                 return False
             
             console.print(f"[blue]Loading SyftBox client from: {self.config_path}[/blue]")
-            self.client = Client.load(self.config_path)
+            self.client = _load_client(self.config_path, self.config_path.stat().st_mtime)
             
             # Get app folder path following SyftBox structure
-            app_folder = self.client.workspace.data_dir / "apps" / app_name
-            app_pid_file = app_folder / "data" / "app.pid"
-            app_port_file = app_folder / "data" / "app.port"
+            app_folder, app_pid_file, app_port_file = _app_files(
+                self.client.workspace.data_dir, app_name
+            )
             
             console.print(f"[blue]Looking for RAG service at: {app_folder}[/blue]")
             
@@ -58,30 +86,41 @@ class RAGServiceDetector:
                 return False
             
             # Wait for service to be ready (similar to spawn_services.py lines 289-304)
-            start_time = time.time()
+            deadline = time.monotonic() + max_wait_time
             console.print(f"[blue]Waiting for RAG service (max {max_wait_time}s)...[/blue]")
             
-            while time.time() - start_time < max_wait_time:
-                if app_port_file.exists() and app_pid_file.exists():
-                    try:
-                        # Read port and PID
-                        self.rag_service_port = app_port_file.read_text().strip()
-                        self.rag_service_pid = app_pid_file.read_text().strip()
-                        
-                        # Construct service URL
-                        self.rag_service_url = f"http://localhost:{self.rag_service_port}"
-                        
-                        console.print(f"[green]✓ RAG service detected![/green]")
-                        console.print(f"  URL: {self.rag_service_url}")
-                        console.print(f"  PID: {self.rag_service_pid}")
-                        
-                        return True
-                        
-                    except Exception as e:
-                        console.print(f"[red]Error reading service metadata: {e}[/red]")
-                        return False
+            attempt = 0
+            while True:
+                # Reading the files directly doubles as the existence check
+                try:
+                    port = app_port_file.read_text().strip()
+                    pid = app_pid_file.read_text().strip()
+                except FileNotFoundError:
+                    port = None
+                except OSError as e:
+                    console.print(f"[red]Error reading service metadata: {e}[/red]")
+                    return False
+                
+                if port is not None:
+                    self.rag_service_port = port
+                    self.rag_service_pid = pid
+                    
+                    # Construct service URL
+                    self.rag_service_url = f"http://localhost:{self.rag_service_port}"
+                    
+                    console.print(f"[green]✓ RAG service detected![/green]")
+                    console.print(f"  URL: {self.rag_service_url}")
+                    console.print(f"  PID: {self.rag_service_pid}")
+                    
+                    return True
                 
-                time.sleep(1)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                # Exponential backoff: 50ms, 100ms, 200ms, ... capped at 1s
+                time.sleep(min(1.0, 0.05 * 2 ** attempt, remaining))
+                attempt += 1
             
             console.print(f"[yellow]RAG service not detected within {max_wait_time} seconds[/yellow]")
             return False
@@ -99,17 +138,49 @@ class RAGServiceDetector:
         return self.rag_service_url
     
     def verify_service_health(self) -> bool:
-        """Verify RAG service is responding (basic health check)."""
-        if not self.rag_service_url:
+        """Verify RAG service is responding (basic health check).
+        
+        A result older than HEALTH_TTL is still returned immediately while
+        it is refreshed in the background, so only the first check blocks.
+        """
+        url = self.rag_service_url
+        if not url:
             return False
         
+        healthy = self._cache.get(url)
+        if healthy is not None:
+            return healthy
+        
+        with self._health_lock:
+            stale = self._last_health.get(url)
+            if stale is not None and url not in self._refreshing:
+                self._refreshing.add(url)
+                threading.Thread(target=self._refresh_health, args=(url,), daemon=True).start()
+        
+        if stale is not None:
+            return stale
+        return self._check_health(url)
+    
+    def _refresh_health(self, url: str):
         try:
-            import requests
-            response = requests.get(f"{self.rag_service_url}/health", timeout=5)
-            return response.status_code == 200
-        except Exception as e:
+            self._check_health(url)
+        finally:
+            with self._health_lock:
+                self._refreshing.discard(url)
+    
+    def _check_health(self, url: str) -> bool:
+        """GET the service's health endpoint and remember the result."""
+        try:
+            response = self.session.get(f"{url}/health", timeout=(2, 5))
+            healthy = response.status_code == 200
+            self._cache.set(url, healthy, HEALTH_TTL)
+        except requests.RequestException as e:
             console.print(f"[yellow]RAG service health check failed: {e}[/yellow]")
-            return False
+            healthy = False
+        
+        with self._health_lock:
+            self._last_health[url] = healthy
+        return healthy
     
     def get_service_info(self) -> dict:
         """Get service information dictionary."""
@@ -0,0 +1,160 @@
+"""Thread-safe rate limiting for outgoing HTTP requests."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket limiter shared between fetcher worker threads."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second. Zero or less disables limiting.
+            capacity: Maximum number of tokens that can accumulate (burst size)
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate: float):
+        """Change the refill rate, keeping tokens accrued so far."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for the given number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class DomainLimiter:
+    """Adaptive per-domain rate limiter (additive increase, multiplicative decrease).
+
+    Each domain starts at the configured rate. After a run of successful
+    responses the rate grows by a fixed step; a 429 or 503 halves it and
+    honours any Retry-After the server sent. Other errors break the run
+    of successes without changing the rate.
+    """
+
+    THROTTLE_STATUSES = (429, 503)
+
+    def __init__(self,
+                 rate: float,
+                 capacity: int = 1,
+                 max_rate: Optional[float] = None,
+                 success_threshold: int = 20):
+        """Initialize domain limiter.
+
+        Args:
+            rate: Starting requests per second per domain. Zero or less disables limiting.
+            capacity: Burst size of each domain's token bucket
+            max_rate: Upper bound for additive increases (defaults to 10x the starting rate)
+            success_threshold: Consecutive successes before the rate is increased
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = rate / 16
+        self.max_rate = max_rate if max_rate is not None else rate * 10
+        self.increase = rate
+        self.success_threshold = success_threshold
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._successes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, netloc: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(netloc)
+            if bucket is None:
+                bucket = self._buckets[netloc] = TokenBucket(self.rate, self.capacity)
+                self._successes[netloc] = 0
+            return bucket
+
+    def acquire(self, url: str):
+        """Block until a request to the URL's domain is allowed."""
+        if self.rate <= 0:
+            return
+        self._bucket(urlparse(url).netloc).acquire()
+
+    def record(self, url: str, status_code: int, retry_after: Optional[str] = None):
+        """Adjust the domain's rate based on a response."""
+        if self.rate <= 0:
+            return
+
+        netloc = urlparse(url).netloc
+        bucket = self._bucket(netloc)
+
+        with self._lock:
+            if status_code in self.THROTTLE_STATUSES:
+                self._successes[netloc] = 0
+                new_rate = max(self.min_rate, bucket.rate * 0.5)
+            elif status_code >= 400:
+                # Other errors are not throttling, but are no reason to speed up
+                self._successes[netloc] = 0
+                return
+            else:
+                self._successes[netloc] += 1
+                if self._successes[netloc] < self.success_threshold:
+                    return
+                self._successes[netloc] = 0
+                new_rate = min(self.max_rate, bucket.rate + self.increase)
+
+        bucket.set_rate(new_rate)
+
+        delay = _parse_retry_after(retry_after) if status_code in self.THROTTLE_STATUSES else None
+        if delay:
+            bucket.pause(delay)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())